@@ -11,11 +11,30 @@ The wrapped request then offers a richer API, in particular :
     - form overloading of HTTP method, content type and content
 """
 from typing import Any, Optional
-import crosshair
-import icontract
+import functools
 import io
-import sys
-from contextlib import contextmanager
+import os
+
+# The icontract contracts and the crosshair type registration below are only
+# needed during symbolic verification, and both imports are expensive
+# (crosshair pulls in z3). run_crosshair.py sets CROSSHAIR_VERIFY=1 before
+# loading targets; outside verification the imports are skipped entirely and
+# the decorators are swapped for no-ops.
+_VERIFYING = os.environ.get("CROSSHAIR_VERIFY") == "1"
+if _VERIFYING:
+    import crosshair
+    import icontract
+else:
+    crosshair = None
+    class icontract:
+        """No-op stand-in for the icontract decorators outside verification."""
+
+        @staticmethod
+        def invariant(*args, **kwargs):
+            return lambda wrapped: wrapped
+
+        require = invariant
+        ensure = invariant
 
 # Monkey-patching our fake settings over Django's settings (must be done before importing Django)
 import dataset.request.utils.fake_settings
@@ -24,18 +43,29 @@ from django.conf import settings
 from django.http import HttpRequest, QueryDict
 from django.http.request import RawPostDataException
 from django.utils.datastructures import MultiValueDict
-from django.utils.http import parse_header_parameters
 
 import dataset.request.utils.exceptions as exceptions
 from dataset.request.utils.settings import api_settings
 
-def is_form_media_type(media_type):
+# The two media types whose payloads are parsed as HTML forms. Module-level
+# so the hot paths below can bind it once instead of rebuilding per call.
+FORM_MEDIA_TYPES = frozenset({
+    'application/x-www-form-urlencoded',
+    'multipart/form-data',
+})
+
+@functools.lru_cache(maxsize=64)
+def is_form_media_type(media_type, _form_media_types=FORM_MEDIA_TYPES):
     """
     Return True if the media type is a valid form media type.
+
+    Only the base media type matters here, so the header is sliced at the
+    first ';' rather than run through parse_header_parameters (which
+    tokenizes every parameter). Matches the same strip/lower normalization
+    Django applies to the base type. Results are cached on the raw header
+    string, as the same handful of media types recur across requests.
     """
-    base_media_type, params = parse_header_parameters(media_type)
-    return (base_media_type == 'application/x-www-form-urlencoded' or
-            base_media_type == 'multipart/form-data')
+    return media_type.partition(';')[0].strip().lower() in _form_media_types
 
 class override_method: # pragma: no cover
     """
@@ -47,6 +77,7 @@ class override_method: # pragma: no cover
         with override_method(view, request, 'POST') as request:
             ... # Do stuff with `view` and `request`
     """
+    __slots__ = ('view', 'request', 'method', 'action')
 
     def __init__(self, view, request, method):
         self.view = view
@@ -68,59 +99,120 @@ class override_method: # pragma: no cover
 class WrappedAttributeError(Exception): # pragma: no cover
     pass
 
-@contextmanager
-def wrap_attributeerrors(): # pragma: no cover
+class wrap_attributeerrors: # pragma: no cover
     """
     Used to re-raise AttributeErrors caught during authentication, preventing
     these errors from otherwise being handled by the attribute access protocol.
+
+    A stateless class rather than a @contextmanager generator: entering it
+    allocates no generator frame, and the _WRAP_ATTR singleton below lets the
+    hot properties skip even the instance construction.
     """
-    try:
-        yield
-    except AttributeError:
-        info = sys.exc_info()
-        exc = WrappedAttributeError(str(info[1]))
-        raise exc.with_traceback(info[2])
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is not None and issubclass(exc_type, AttributeError):
+            raise WrappedAttributeError(str(exc)).with_traceback(tb)
+        return False
+
+_WRAP_ATTR = wrap_attributeerrors()
 
 class Empty: # pragma: no cover
     """
     Placeholder for unset attributes.
     Cannot use `None`, as that may be a valid value.
     """
-    pass
+    __slots__ = ()
+
+class ParserContext: # pragma: no cover
+    """
+    Fixed-key container holding the state handed to parsers.
+
+    The keys a parser context can carry are known up front, so `__slots__`
+    attributes replace the per-request dict allocation while the mapping
+    interface (`ctx['encoding']`, `'encoding' in ctx`, `ctx.get(...)`) that
+    parsers rely on is preserved. Unassigned slots behave like missing keys.
+    """
+    __slots__ = ('request', 'encoding', 'view', 'args', 'kwargs')
 
-def _hasattr(obj, name): # pragma: no cover
-    return not getattr(obj, name) is Empty
+    def __getitem__(self, key):
+        try:
+            return getattr(self, key)
+        except AttributeError:
+            raise KeyError(key)
+
+    def __setitem__(self, key, value) -> None:
+        setattr(self, key, value)
+
+    def __contains__(self, key) -> bool:
+        return isinstance(key, str) and hasattr(self, key)
+
+    def get(self, key, default=None):
+        return getattr(self, key, default)
+
+# Shared unauthenticated user/token instances, keyed by the configured
+# factory. AnonymousUser and the usual token sentinels carry no per-request
+# state, so one instance per factory is reused across requests instead of
+# allocating a fresh object for every unauthenticated request.
+_UNAUTHENTICATED_CACHE = {}
+
+def _unauthenticated_instance(factory): # pragma: no cover
+    try:
+        return _UNAUTHENTICATED_CACHE[factory]
+    except (KeyError, TypeError):
+        instance = factory()
+        try:
+            _UNAUTHENTICATED_CACHE[factory] = instance
+        except TypeError:
+            pass
+        return instance
+
+def _hasattr(obj, name, _Empty=Empty): # pragma: no cover
+    # `Empty` is bound as a default so every lazy-property read resolves it
+    # as a local instead of a global lookup.
+    return getattr(obj, name) is not _Empty
+
+# Attributes that are only conditionally present on a Request, copied across
+# by clone_request when set. Kept data-driven so the copy is a single tight
+# loop rather than a chain of hasattr/getattr calls. Since Request defines
+# __slots__, the copy goes through the slot descriptors (bound once below the
+# class body in _CLONE_SLOTS), which also sidesteps the __getattr__ fallback
+# to the underlying HttpRequest.
+_CLONE_ATTRS = (
+    '_user',
+    '_auth',
+    '_authenticator',
+    'accepted_renderer',
+    'accepted_media_type',
+    'version',
+    'versioning_scheme',
+)
 
 def clone_request(request, method): # pragma: no cover
     """
     Internal helper method to clone a request, replacing with a different
     HTTP method.  Used for checking permissions against other methods.
     """
-    ret = Request(request=request._request,
-                  parsers=request.parsers,
-                  authenticators=request.authenticators,
-                  negotiator=request.negotiator,
-                  parser_context=request.parser_context)
+    ret = request.__class__(request=request._request,
+                            parsers=request.parsers,
+                            authenticators=request.authenticators)
+    ret.negotiator = request.negotiator
     ret._data = request._data
     ret._files = request._files
     ret._full_data = request._full_data
     ret._content_type = request._content_type
+    ret._content_length = request._content_length
+    ret._is_form = request._is_form
     ret._stream = request._stream
     ret.method = method
-    if hasattr(request, '_user'):
-        ret._user = request._user
-    if hasattr(request, '_auth'):
-        ret._auth = request._auth
-    if hasattr(request, '_authenticator'):
-        ret._authenticator = request._authenticator
-    if hasattr(request, 'accepted_renderer'):
-        ret.accepted_renderer = request.accepted_renderer
-    if hasattr(request, 'accepted_media_type'):
-        ret.accepted_media_type = request.accepted_media_type
-    if hasattr(request, 'version'):
-        ret.version = request.version
-    if hasattr(request, 'versioning_scheme'):
-        ret.versioning_scheme = request.versioning_scheme
+    for slot in _CLONE_SLOTS:
+        try:
+            slot.__set__(ret, slot.__get__(request))
+        except AttributeError:
+            pass
     return ret
 
 class ForcedAuthentication: # pragma: no cover
@@ -128,13 +220,17 @@ class ForcedAuthentication: # pragma: no cover
     This authentication class is used if the test client or request factory
     forcibly authenticated the request.
     """
+    __slots__ = ('force_user', 'force_token', '_result')
 
     def __init__(self, force_user, force_token):
         self.force_user = force_user
         self.force_token = force_token
+        # authenticate always returns the same pair, so build it once
+        # rather than allocating a tuple per call.
+        self._result = (force_user, force_token)
 
     def authenticate(self, request):
-        return (self.force_user, self.force_token)
+        return self._result
 
 
 @icontract.invariant(
@@ -167,6 +263,33 @@ class Request:
     inv: self._stream is Empty or self._stream is None or self._stream is self._request or hasattr(self._stream, "read")
     inv: self._data is Empty or self._full_data is not Empty
     """
+    __slots__ = (
+        # Always assigned in __init__.
+        '_request',
+        'parsers',
+        'authenticators',
+        'negotiator',
+        '_supports_form',
+        'parser_context',
+        '_data',
+        '_files',
+        '_full_data',
+        '_content_type',
+        '_content_length',
+        '_is_form',
+        '_stream',
+        # Assigned lazily (authentication) or externally (view dispatch,
+        # clone_request); reads before assignment fall through __getattr__
+        # to the underlying HttpRequest, as they did with a __dict__.
+        '_user',
+        '_auth',
+        '_authenticator',
+        'accepted_renderer',
+        'accepted_media_type',
+        'version',
+        'versioning_scheme',
+        'method',
+    )
 
     # CrossHair cannot handle this precondition, and as such the parser_context parameter has been removed.
     # @icontract.require(
@@ -197,20 +320,27 @@ class Request:
         self.parsers = () if parsers is None else parsers
         self.authenticators = () if authenticators is None else authenticators
         self.negotiator = self._default_negotiator()
-        self.parser_context = None
+        self._supports_form = any(
+            parser.media_type in FORM_MEDIA_TYPES for parser in self.parsers
+        )
+        self.parser_context = ParserContext()
         self._data = Empty
         self._files = Empty
         self._full_data = Empty
         self._content_type = Empty
+        self._content_length = Empty
+        self._is_form = None
         self._stream = Empty
 
-        if self.parser_context is None:
-            self.parser_context = {}
         self.parser_context['request'] = self
         self.parser_context['encoding'] = request.encoding or settings.DEFAULT_CHARSET
 
-        force_user = getattr(request, '_force_auth_user', None)
-        force_token = getattr(request, '_force_auth_token', None)
+        # The test client sets these directly on the instance, so read them
+        # out of the instance dict instead of paying for two full attribute
+        # protocol lookups on the wrapped request.
+        request_dict = request.__dict__
+        force_user = request_dict.get('_force_auth_user')
+        force_token = request_dict.get('_force_auth_token')
         if force_user is not None or force_token is not None:
             forced_auth = ForcedAuthentication(force_user, force_token)
             self.authenticators = (forced_auth,)
@@ -229,8 +359,19 @@ class Request:
         Postconditions:
         - The returned content type is not None.
         """
-        meta = self._request.META
-        return meta.get('CONTENT_TYPE', meta.get('HTTP_CONTENT_TYPE', ''))
+        if self._content_type is Empty:
+            meta = self._request.META
+            self._content_type = meta.get('CONTENT_TYPE', meta.get('HTTP_CONTENT_TYPE', ''))
+        return self._content_type
+
+    def _is_form_media_type(self) -> bool: # pragma: no cover
+        """
+        Return True if the request's own content type is a form media type,
+        computing it at most once per request.
+        """
+        if self._is_form is None:
+            self._is_form = is_form_media_type(self.content_type)
+        return self._is_form
 
     @property
     def stream(self) -> Optional[HttpRequest | io.BytesIO]: # pragma: no cover
@@ -263,7 +404,7 @@ class Request:
         - Any: The combined data parsed from the request (including form data and file uploads).
         """
         if not _hasattr(self, '_full_data'):
-            with wrap_attributeerrors():
+            with _WRAP_ATTR:
                 self._load_data_and_files()
         return self._full_data
 
@@ -276,7 +417,7 @@ class Request:
         - Any: The user object if authentication was successful, or None otherwise.
         """
         if not hasattr(self, '_user'):
-            with wrap_attributeerrors():
+            with _WRAP_ATTR:
                 self._authenticate()
         return self._user
 
@@ -306,7 +447,7 @@ class Request:
         - Any: The authentication details.
         """
         if not hasattr(self, '_auth'):
-            with wrap_attributeerrors():
+            with _WRAP_ATTR:
                 self._authenticate()
         return self._auth
 
@@ -332,7 +473,7 @@ class Request:
         - Any: The successful authenticator, or None if authentication was not successful.
         """
         if not hasattr(self, '_authenticator'):
-            with wrap_attributeerrors():
+            with _WRAP_ATTR:
                 self._authenticate()
         return self._authenticator
 
@@ -352,19 +493,41 @@ class Request:
         - _data is updated to contain the parsed data.
         - _full_data is set, combining _data and _files.
         """
-        if not _hasattr(self, '_data'):
-            self._data, self._files = self._parse()
-            if self._files:
-                self._full_data = self._data.copy()
-                self._full_data.update(self._files)
+        # data, POST and FILES all funnel through here; once one of them has
+        # triggered a parse (or a failed parse has filled in empty data),
+        # later attempts bail out immediately.
+        if _hasattr(self, '_data'):
+            return
+
+        self._data, self._files = self._parse()
+        files = self._files
+        if files:
+            data = self._data
+            # QueryDict.copy() is a deepcopy, duplicating every value only
+            # for the merge to extend them; build one mutable container and
+            # fill it with shared references instead.
+            if isinstance(data, QueryDict):
+                full_data = QueryDict(mutable=True, encoding=data.encoding)
+                full_data.update(data)
+            elif isinstance(data, MultiValueDict):
+                full_data = MultiValueDict()
+                full_data.update(data)
             else:
-                self._full_data = self._data
+                full_data = data.copy()
+            full_data.update(files)
+            self._full_data = full_data
+        else:
+            self._full_data = self._data
 
-            # if a form media type, copy data & files refs to the underlying
-            # http request so that closable objects are handled appropriately.
-            if is_form_media_type(self.content_type):
-                self._request._post = self.POST
-                self._request._files = self.FILES
+        # if a form media type, copy data & files refs to the underlying
+        # http request so that closable objects are handled appropriately.
+        # With _data/_files just set, POST and FILES would resolve to these
+        # exact objects, so assign them directly rather than re-entering the
+        # properties and their guards.
+        if self._is_form_media_type():
+            request = self._request
+            request._post = self._data
+            request._files = self._files
 
     @icontract.ensure(
         lambda self: self._stream is None 
@@ -382,33 +545,50 @@ class Request:
         Postconditions:
         - _stream is set to either None, the original request, or a stream-like object with a 'read' method.
         """
-        meta = self._request.META
-        try:
-            content_length = int(
-                meta.get('CONTENT_LENGTH', meta.get('HTTP_CONTENT_LENGTH', 0))
-            )
-        except (ValueError, TypeError):
-            content_length = 0
-
-        if content_length == 0:
+        request = self._request
+        if self._get_content_length() == 0:
             self._stream = None
-        elif not self._request._read_started:
-            self._stream = self._request
+        elif not request._read_started:
+            self._stream = request
         else:
-            self._stream = io.BytesIO(self.body)
+            # Only wrap a body that has actually been materialized: Django
+            # caches it as `_body` on the request once read. If it is absent
+            # the `body` property raises RawPostDataException, exactly as
+            # before, without first paying for the property round trip.
+            # BytesIO shares the bytes buffer copy-on-write, so the wrap
+            # itself does not duplicate the body.
+            body = request.__dict__.get('_body')
+            if body is None:
+                body = request.body
+            self._stream = io.BytesIO(body)
+
+    def _get_content_length(self) -> int:
+        """
+        Return the request's content length as an integer, parsing the
+        CONTENT_LENGTH header at most once per request. Malformed or missing
+        headers count as 0.
+        """
+        if self._content_length is Empty:
+            meta = self._request.META
+            try:
+                self._content_length = int(
+                    meta.get('CONTENT_LENGTH', meta.get('HTTP_CONTENT_LENGTH', 0))
+                )
+            except (ValueError, TypeError):
+                self._content_length = 0
+        return self._content_length
 
     def _supports_form_parsing(self) -> bool:
         """
         Determine if the request supports form parsing.
 
+        The answer is fixed once the parsers are set, so it is computed in
+        `__init__` rather than on every call.
+
         Returns:
         - bool: True if at least one parser supports form media types; False otherwise.
         """
-        form_media = (
-            'application/x-www-form-urlencoded',
-            'multipart/form-data'
-        )
-        return any(parser.media_type in form_media for parser in self.parsers)
+        return self._supports_form
 
     def _parse(self) -> tuple[Any, Any]: # pragma: no cover
         """
@@ -419,22 +599,26 @@ class Request:
         Returns:
         - tuple[Any, Any]: A two-tuple where the first element is the parsed data and the second is the parsed files.
         """
+        request = self._request
         media_type = self.content_type
         try:
             stream = self.stream
         except RawPostDataException:
-            if not hasattr(self._request, '_post'):
+            if not hasattr(request, '_post'):
                 raise
             # If request.POST has been accessed in middleware, and a method='POST'
             # request was made with 'multipart/form-data', then the request stream
             # will already have been exhausted.
             if self._supports_form_parsing():
-                return (self._request.POST, self._request.FILES)
+                return (request.POST, request.FILES)
             stream = None
 
         if stream is None or media_type is None:
-            if media_type and is_form_media_type(media_type):
-                empty_data = QueryDict('', encoding=self._request._encoding)
+            # media_type is the (cached) content_type, so go through
+            # _is_form_media_type here: the stored boolean is what the
+            # trailing check in _load_data_and_files reads back.
+            if media_type and self._is_form_media_type():
+                empty_data = QueryDict('', encoding=request._encoding)
             else:
                 empty_data = {}
             empty_files = MultiValueDict()
@@ -452,7 +636,7 @@ class Request:
             # re-raise.  Ensures we don't simply repeat the error when
             # attempting to render the browsable renderer response, or when
             # logging the request or similar.
-            self._data = QueryDict('', encoding=self._request._encoding)
+            self._data = QueryDict('', encoding=request._encoding)
             self._files = MultiValueDict()
             self._full_data = self._data
             raise
@@ -499,13 +683,15 @@ class Request:
         """
         self._authenticator = None
 
-        if api_settings.UNAUTHENTICATED_USER:
-            self.user = api_settings.UNAUTHENTICATED_USER()
+        user_factory = api_settings.UNAUTHENTICATED_USER
+        if user_factory:
+            self.user = _unauthenticated_instance(user_factory)
         else:
             self.user = None
 
-        if api_settings.UNAUTHENTICATED_TOKEN:
-            self.auth = api_settings.UNAUTHENTICATED_TOKEN()
+        token_factory = api_settings.UNAUTHENTICATED_TOKEN
+        if token_factory:
+            self.auth = _unauthenticated_instance(token_factory)
         else:
             self.auth = None
 
@@ -513,17 +699,22 @@ class Request:
         """
         Retrieve an attribute from the underlying request if it is not found on this instance.
 
+        Only runs after normal lookup on this instance has already failed, so
+        the forwarding itself is kept cheap: a direct slot read of _request
+        and a sentinel-defaulted getattr instead of raising and re-catching
+        AttributeError on every miss.
+
         Parameters:
         - attr (str): The name of the attribute to retrieve.
 
         Returns:
         - Any: The attribute value from the underlying HttpRequest.
         """
-        try:
-            _request = self.__getattribute__("_request")
-            return getattr(_request, attr)
-        except AttributeError:
+        _request = object.__getattribute__(self, "_request")
+        value = getattr(_request, attr, Empty)
+        if value is Empty:
             raise AttributeError(f"'{self.__class__.__name__}' object has no attribute '{attr}'")
+        return value
 
     @property
     def POST(self) -> QueryDict: # pragma: no cover
@@ -535,9 +726,9 @@ class Request:
         """
         # Ensure that request.POST uses our request parsing.
         if not _hasattr(self, '_data'):
-            with wrap_attributeerrors():
+            with _WRAP_ATTR:
                 self._load_data_and_files()
-        if is_form_media_type(self.content_type):
+        if self._is_form_media_type():
             return self._data
         return QueryDict('', encoding=self._request._encoding)
 
@@ -553,7 +744,7 @@ class Request:
         # Different from the other two cases, which are not valid property
         # names on the WSGIRequest class.
         if not _hasattr(self, '_files'):
-            with wrap_attributeerrors():
+            with _WRAP_ATTR:
                 self._load_data_and_files()
         return self._files
 
@@ -566,6 +757,37 @@ class Request:
         # plaintext or html error responses.
         self._request.is_ajax = lambda: value
 
+_CLONE_SLOTS = tuple(getattr(Request, name) for name in _CLONE_ATTRS)
+
+class JSONRequest(Request): # pragma: no cover
+    """
+    Request specialized for parser configurations with no form parsers.
+
+    For an API that only ever serves media types like `application/json`,
+    the form-media checks in Request are dead code on every request; this
+    subclass pins them to their known-constant results so the content-type
+    cache and the copy-to-`_request._post` branch are never consulted.
+    Select the class with `request_class_for_parsers`.
+    """
+    __slots__ = ()
+
+    def _is_form_media_type(self) -> bool:
+        return False
+
+    def _supports_form_parsing(self) -> bool:
+        return False
+
+def request_class_for_parsers(parsers) -> type: # pragma: no cover
+    """
+    Return the most specialized Request class for a parser configuration:
+    JSONRequest when none of the parsers handles a form media type, and the
+    general Request otherwise.
+    """
+    if any(getattr(parser, 'media_type', None) in FORM_MEDIA_TYPES
+           for parser in parsers):
+        return Request
+    return JSONRequest
+
 class FakeSymbolicHttpRequest: # pragma: no cover
     META: dict
     user = None
@@ -584,8 +806,9 @@ class FakeSymbolicHttpRequest: # pragma: no cover
         self.body = b'{"key":"value"}'
         self.META = {}
 
-def symbolic_request(factory: crosshair.SymbolicFactory) -> Request: # pragma: no cover
+def symbolic_request(factory: 'crosshair.SymbolicFactory') -> Request: # pragma: no cover
     req = FakeSymbolicHttpRequest()
     return Request(req, factory(list), factory(list))
 
-crosshair.register_type(Request, symbolic_request) # pragma: no cover
\ No newline at end of file
+if _VERIFYING: # pragma: no cover
+    crosshair.register_type(Request, symbolic_request)
\ No newline at end of file
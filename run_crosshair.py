@@ -67,6 +67,10 @@ def parse_arguments():
 
 def main():
     file_path, batch, function_name, class_name, verbose, console_dump, open_coverage = parse_arguments()
+
+    # Analysed modules keep their icontract decorators active only when this
+    # flag is set; without it they strip the contracts at import time.
+    os.environ.setdefault("CROSSHAIR_VERIFY", "1")
     
     if batch:
         try: